@@ -2,24 +2,69 @@
 different services using MQTT.
 """
 import os
+import hashlib
 import json
 import logging
-from io import StringIO
 from time import sleep, time
 from typing import Any
 import paho.mqtt.client as mqtt
-from typing import Any, Dict, Union
+from typing import Any, Callable, Dict, Union
 import pandas as pd
 import schedule
-from datetime import datetime
-from math import radians, cos, sin, asin, sqrt
 
 import math
 import numpy as np
+import numpy.typing as npt
 
 import axis_ptz_utilities
 from base_mqtt_pub_sub import BaseMQTTPubSub
 
+# Square of the WGS84 eccentricity, from the ellipsoid used by
+# axis_ptz_utilities.compute_r_XYZ
+E_SQUARED = 2.0 / axis_ptz_utilities.F_INV - 1.0 / axis_ptz_utilities.F_INV**2  # [-]
+
+
+def _to_float_array(column: pd.Series) -> npt.NDArray[np.float64]:
+    """Convert a ledger column to a float64 array, coercing values that are
+    not numeric to NaN rather than falling back to an object array.
+
+    Args:
+        column (pd.Series): ledger column
+
+    Returns:
+        np.ndarray: float64 values of the column
+    """
+    return pd.to_numeric(column, errors="coerce").to_numpy(dtype=np.float64)
+
+
+def compute_r_XYZ_vec(
+    d_lambda: npt.NDArray[np.float64],
+    d_varphi: npt.NDArray[np.float64],
+    o_h: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """Compute positions in the geocentric (XYZ) coordinate system given
+    geodetic longitudes and latitudes, and altitudes. This is a vectorized
+    port of axis_ptz_utilities.compute_r_XYZ.
+
+    Args:
+        d_lambda (np.ndarray): geodetic longitudes [deg]
+        d_varphi (np.ndarray): geodetic latitudes [deg]
+        o_h (np.ndarray): altitudes [m]
+
+    Returns:
+        np.ndarray: (N, 3) array of geocentric positions [m]
+    """
+    lambda_ = np.deg2rad(d_lambda)
+    varphi = np.deg2rad(d_varphi)
+    sin_varphi = np.sin(varphi)
+    cos_varphi = np.cos(varphi)
+    N = axis_ptz_utilities.R_OPLUS / np.sqrt(1.0 - E_SQUARED * sin_varphi**2)
+    r_XYZ = np.empty((len(lambda_), 3))
+    r_XYZ[:, 0] = (N + o_h) * cos_varphi * np.cos(lambda_)
+    r_XYZ[:, 1] = (N + o_h) * cos_varphi * np.sin(lambda_)
+    r_XYZ[:, 2] = ((1.0 - E_SQUARED) * N + o_h) * sin_varphi
+    return r_XYZ
+
 
 class C2PubSub(BaseMQTTPubSub):
     """The C2PubSub is a class that wraps command and control functionalities. Currently,
@@ -31,6 +76,37 @@ class C2PubSub(BaseMQTTPubSub):
 
     FILE_INTERVAL = 1  # minutes
     EARTH_RADIUS_KM = 6371
+    LEDGER_REPUBLISH_INTERVAL = 10  # seconds
+
+    # Object data required to calculate the camera angles
+    _REQUIRED_OBJECT_KEYS = frozenset(
+        [
+            "timestamp",
+            "latitude",
+            "longitude",
+            "altitude",
+            "track",
+            "horizontal_velocity",
+            "vertical_velocity",
+        ]
+    )
+
+    # Selected object payload fields, and the type each value is cast to
+    _PAYLOAD_FIELDS: tuple[tuple[str, Callable[[Any], Any]], ...] = (
+        ("object_type", str),
+        ("timestamp", float),
+        ("latitude", float),
+        ("longitude", float),
+        ("altitude", float),
+        ("track", float),
+        ("horizontal_velocity", float),
+        ("vertical_velocity", float),
+        ("relative_distance", float),
+        ("camera_tilt", float),
+        ("camera_pan", float),
+        ("distance_3d", float),
+        ("age", float),
+    )
 
     def __init__(
         self: Any,
@@ -102,18 +178,36 @@ class C2PubSub(BaseMQTTPubSub):
         self.log_level = log_level
         self.override_object = None
         self.tracked_object = None
+        # Digest and time of the last ledger published, to skip
+        # republishing an unchanged ledger
+        self._last_ledger_hash: Union[bytes, None] = None
+        self._last_ledger_publish_time = 0.0
 
         if self.mapping_filepath == "":
             self.occlusion_mapping_enabled = False
         else:
             with open(mapping_filepath) as f:
-                self.occlusion_mapping = json.load(f)
+                occlusion_mapping = json.load(f)
             self.occlusion_mapping_enabled = True
 
+            # Store the Occlusion Mapping Points as parallel azimuth and
+            # elevation arrays, sorted by azimuth so the point covering a
+            # given azimuth can be found with a binary search
+            occ_az = np.array(
+                [point["azimuth"] for point in occlusion_mapping], dtype=np.float64
+            )
+            occ_el = np.array(
+                [point["elevation"] for point in occlusion_mapping], dtype=np.float64
+            )
+            order = np.argsort(occ_az, kind="stable")
+            self._occ_az = occ_az[order]
+            self._occ_el = occ_el[order]
+
         # Compute tripod position in the geocentric (XYZ) coordinate
         # system
-        self.r_XYZ_t = axis_ptz_utilities.compute_r_XYZ(
-            self.lambda_t, self.varphi_t, self.h_t
+        self.r_XYZ_t = np.ascontiguousarray(
+            axis_ptz_utilities.compute_r_XYZ(self.lambda_t, self.varphi_t, self.h_t),
+            dtype=np.float64,
         )
 
         # Compute orthogonal transformation matrix from geocentric
@@ -146,7 +240,21 @@ class C2PubSub(BaseMQTTPubSub):
             self.rho_c,
             self.tau_c,
         )
-        
+
+        # Cache contiguous transposes of the constant rotation matrices
+        self.E_ENz_to_XYZ = np.ascontiguousarray(self.E_XYZ_to_ENz.T)
+
+        # Compose the rotation from the topocentric (ENz) coordinate
+        # system, through geocentric (XYZ), to the camera housing fixed
+        # (uvw) coordinate system, and cache its contiguous transpose
+        self.E_ENz_to_uvw = np.matmul(self.E_XYZ_to_uvw, self.E_ENz_to_XYZ)
+        self.E_uvw_to_ENz = np.ascontiguousarray(self.E_ENz_to_uvw.T)
+
+        # Precompute the device location terms of the Haversine formula
+        self._dev_lat_rad = math.radians(self.device_latitude)
+        self._dev_lon_rad = math.radians(self.device_longitude)
+        self._cos_dev_lat = math.cos(self._dev_lat_rad)
+        self._earth_diameter_m = 2.0 * self.earth_radius_km * 1000.0
 
         # create MQTT client connection
         self.connect_client()
@@ -180,146 +288,95 @@ class C2PubSub(BaseMQTTPubSub):
             """
         )
 
-    def _calculate_camera_angles(self: Any, data: Any) -> tuple[float, float, float]:
-        # Calculate the relative tilt and pan angles of the object compared to the device
-        # Your calculation logic here
-
-        # Assign identifier, time, position, and velocity of the
-        # object
-
-        if not set(
-            [
-                "timestamp",
-                "latitude",
-                "longitude",
-                "altitude",
-                "track",
-                "horizontal_velocity",
-                "vertical_velocity",
-            ]
-        ) <= set(data.keys()):
-            logging.info(f"Required keys missing from object message data: {data}")
-            return 0.0, 0.0, 0.0
-        # logging.info(f"Processing object msg data: {data}")
-        self.timestamp_o = float(data["timestamp"])  # [s]
-        self.timestamp_c = self.timestamp_o
-        self.lambda_o = data["longitude"]  # [deg]
-        self.varphi_o = data["latitude"]  # [deg]
-        self.h_o = data["altitude"]  # [m]
-        track_o = data["track"]  # [deg]
-        ground_speed_o = data["horizontal_velocity"]  # [m/s]
-        vertical_rate_o = data["vertical_velocity"]  # [m/s]
+    def _calculate_camera_angles_vec(
+        self: Any,
+        timestamp_o: npt.NDArray[np.float64],
+        lambda_o: npt.NDArray[np.float64],
+        varphi_o: npt.NDArray[np.float64],
+        h_o: npt.NDArray[np.float64],
+        track_o: npt.NDArray[np.float64],
+        ground_speed_o: npt.NDArray[np.float64],
+        vertical_rate_o: npt.NDArray[np.float64],
+        now: float,
+    ) -> tuple[
+        npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]
+    ]:
+        """Calculate the camera pan and tilt angles, and the 3D distance, for
+        every object in the ledger at once.
 
-        try:
-            # Compute position in the geocentric (XYZ) coordinate system
-            # of the object relative to the tripod at time zero, the
-            # observation time
-            r_XYZ_o_0 = axis_ptz_utilities.compute_r_XYZ(
-                self.lambda_o, self.varphi_o, self.h_o
+        Args:
+            timestamp_o (np.ndarray): object message timestamps [s]
+            lambda_o (np.ndarray): object geodetic longitudes [deg]
+            varphi_o (np.ndarray): object geodetic latitudes [deg]
+            h_o (np.ndarray): object altitudes [m]
+            track_o (np.ndarray): object tracks [deg]
+            ground_speed_o (np.ndarray): object ground speeds [m/s]
+            vertical_rate_o (np.ndarray): object vertical rates [m/s]
+            now (float): current time, shared by all objects [s]
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: pan [deg], tilt [deg],
+            and 3D distance [m] arrays
+        """
+        # Compute positions in the geocentric (XYZ) coordinate system
+        # of the objects relative to the tripod at time zero
+        r_XYZ_o_0_t = compute_r_XYZ_vec(lambda_o, varphi_o, h_o)
+        r_XYZ_o_0_t -= self.r_XYZ_t
+
+        # Assign lead times, adding the age of each object message
+        lead_time = self.lead_time + (now - timestamp_o)  # [s]
+
+        # Compute positions in the topocentric (ENz) coordinate system
+        # of the objects relative to the tripod at time zero, and
+        # advance them in place along the velocities to slightly later
+        # time one, without materializing the (N, 3) velocities
+        r_ENz_o_1_t = r_XYZ_o_0_t @ self.E_ENz_to_XYZ
+        track_o = np.deg2rad(track_o)
+        r_ENz_o_1_t[:, 0] += ground_speed_o * np.sin(track_o) * lead_time
+        r_ENz_o_1_t[:, 1] += ground_speed_o * np.cos(track_o) * lead_time
+        r_ENz_o_1_t[:, 2] += vertical_rate_o * lead_time
+
+        # Compute the distances between the objects and the tripod at
+        # time one
+        distance3d = np.linalg.norm(r_ENz_o_1_t, axis=1)
+
+        # Compute pan and tilt to point the camera at the objects,
+        # rotating from topocentric (ENz) directly to camera housing
+        # (uvw) coordinates
+        r_uvw_o_1_t = r_ENz_o_1_t @ self.E_uvw_to_ENz
+        rho_o = np.degrees(np.arctan2(r_uvw_o_1_t[:, 0], r_uvw_o_1_t[:, 1]))  # [deg]
+        tau_o = np.degrees(
+            np.arctan2(
+                r_uvw_o_1_t[:, 2], np.hypot(r_uvw_o_1_t[:, 0], r_uvw_o_1_t[:, 1])
             )
-            r_XYZ_o_0_t = r_XYZ_o_0 - self.r_XYZ_t
+        )  # [deg]
 
-            # Assign lead time, computing and adding age of object
-            # message, if enabled
-            lead_time = self.lead_time  # [s]
+        return rho_o, tau_o, distance3d
 
-            object_msg_age = time() - self.timestamp_o  # [s]
-            logging.debug(
-                f"Object msg age: {object_msg_age} [s] Lead time: {lead_time} [s]"
-            )
-            lead_time += object_msg_age
-
-            # Compute position and velocity in the topocentric (ENz)
-            # coordinate system of the object relative to the tripod at
-            # time zero, and position at slightly later time one
-            self.r_ENz_o_0_t = np.matmul(self.E_XYZ_to_ENz, r_XYZ_o_0_t)
-            track_o = math.radians(track_o)
-            self.v_ENz_o_0_t = np.array(
-                [
-                    ground_speed_o * math.sin(track_o),
-                    ground_speed_o * math.cos(track_o),
-                    vertical_rate_o,
-                ]
-            )
-            r_ENz_o_1_t = self.r_ENz_o_0_t + self.v_ENz_o_0_t * lead_time
-
-            # Compute position, at time one, and velocity, at time zero,
-            # in the geocentric (XYZ) coordinate system of the object
-            # relative to the tripod
-            r_XYZ_o_1_t = np.matmul(self.E_XYZ_to_ENz.transpose(), r_ENz_o_1_t)
-            v_XYZ_o_0_t = np.matmul(self.E_XYZ_to_ENz.transpose(), self.v_ENz_o_0_t)
-
-            # Compute the distance between the object and the tripod at
-            # time one
-            self.distance3d = axis_ptz_utilities.norm(r_ENz_o_1_t)
-
-            # TODO: Restore?
-            # Compute the distance between the object and the tripod
-            # along the surface of a spherical Earth
-            # distance2d = axis_ptz_utilities.compute_great_circle_distance(
-            #     self.self.lambda_t,
-            #     self.varphi_t,
-            #     self.lambda_o,
-            #     self.varphi_o,
-            # )  # [m]
-
-            # Compute the object azimuth and elevation relative to the
-            # tripod
-            self.azm_o = math.degrees(math.atan2(r_ENz_o_1_t[0], r_ENz_o_1_t[1]))  # [deg]
-            self.elv_o = math.degrees(
-                math.atan2(r_ENz_o_1_t[2], axis_ptz_utilities.norm(r_ENz_o_1_t[0:2]))
-            )  # [deg]
-            # logging.info(f"Object azimuth and elevation: {self.azm_o}, {self.elv_o} [deg]")
-
-            # Compute pan and tilt to point the camera at the object
-            r_uvw_o_1_t = np.matmul(self.E_XYZ_to_uvw, r_XYZ_o_1_t)
-            self.rho_o = math.degrees(math.atan2(r_uvw_o_1_t[0], r_uvw_o_1_t[1]))  # [deg]
-            self.tau_o = math.degrees(
-                math.atan2(r_uvw_o_1_t[2], axis_ptz_utilities.norm(r_uvw_o_1_t[0:2]))
-            )  # [deg]
-
-            return self.rho_o, self.tau_o, self.distance3d
-        except Exception as e:
-            logging.error(f"Error: {e} latitude: {self.varphi_o}, longitude: {self.lambda_o}, altitude: {self.h_o}")
-            return 0.0, 0.0, 0.0
-
-    def _relative_distance_meters(
-        self: Any, lat_one: float, lon_one: float, lat_two: float, lon_two: float
-    ) -> float:
-        """gives an Earth-as-a-sphere-based distance approximation using the Haversine formula
+    def _relative_distance_meters_vec(
+        self: Any, lat_arr: npt.NDArray[np.float64], lon_arr: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.float64]:
+        """gives Earth-as-a-sphere-based distance approximations between the
+        device and each coordinate using the Haversine formula
 
         Args:
-            lat_one (float): latitude of coordindate one
-            lon_one (float): longitude of coordindate one
-            lat_two (float): latitude of coordindate two
-            lon_two (float): longitude of coordindate two
+            lat_arr (np.ndarray): latitudes of the coordinates [deg]
+            lon_arr (np.ndarray): longitudes of the coordinates [deg]
 
         Returns:
-            str: integer distance in metters with the unit abbreviation
+            np.ndarray: distances in meters
         """
-        lat_one, lon_one, lat_two, lon_two = (
-            radians(lat_one),
-            radians(lon_one),
-            radians(lat_two),
-            radians(lon_two),
-        )
+        lat_two = np.deg2rad(lat_arr)
+        lon_two = np.deg2rad(lon_arr)
 
         # Haversine formula
-        return float(
-            (
-                2
-                * asin(
-                    sqrt(
-                        sin((lat_two - lat_one) / 2) ** 2
-                        + cos(lat_one)
-                        * cos(lat_two)
-                        * sin((lon_two - lon_one) / 2) ** 2
-                    )
-                )
-                * self.earth_radius_km
-            )
-            * 1000
+        a = (
+            np.sin((lat_two - self._dev_lat_rad) * 0.5) ** 2
+            + self._cos_dev_lat
+            * np.cos(lat_two)
+            * np.sin((lon_two - self._dev_lon_rad) * 0.5) ** 2
         )
+        return self._earth_diameter_m * np.arcsin(np.sqrt(a))
 
     def decode_payload(
         self, msg: Union[mqtt.MQTTMessage, str], data_payload_type: str
@@ -340,7 +397,7 @@ class C2PubSub(BaseMQTTPubSub):
             The data payload of the message payload
         """
         if type(msg) == mqtt.MQTTMessage:
-            payload = msg.payload.decode()
+            payload = msg.payload
         else:
             payload = msg
         try:
@@ -392,190 +449,215 @@ class C2PubSub(BaseMQTTPubSub):
         self.min_altitude = config.get("min_altitude", self.min_altitude)
         self.max_altitude = config.get("max_altitude", self.max_altitude)
 
-    def _elevation_check(self: Any, azimuth: float, elevation: float) -> bool:
-        """Check if the elevation is within the acceptable range
+    def _elevation_check_vec(
+        self: Any,
+        azimuth: npt.NDArray[np.float64],
+        elevation: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.bool_]:
+        """Check if the elevations are within the acceptable range
 
         Args:
-            elevation (float): The elevation to check
+            azimuth (np.ndarray): The azimuths (pan) to check
+            elevation (np.ndarray): The elevations (tilt) to check
 
         Returns:
-            bool: True if the elevation is within the acceptable range
+            np.ndarray: True where the elevation is within the acceptable range
         """
 
         # Check if Occlusion Mapping is enabled
         # Occlusion is designed for structures that come up from the horizon and block the view of the camera.
         # It doesn't work for overhanging things.
         if self.occlusion_mapping_enabled:
+            if len(self._occ_az) == 0:
+                return np.ones(len(elevation), dtype=bool)
 
-            # Go through all of the Occlusion Mapping Points
-            for i, obj in enumerate(self.occlusion_mapping):
-                # Check if the Azimuth(Pan) is greater or if this is the last point. If it is the last point,
-                # then we can assume it applies to the end of the pan (360)
-                if (obj["azimuth"] > azimuth) or (i == len(self.occlusion_mapping) - 1):
+            # Find the first Occlusion Mapping Point with a greater Azimuth(Pan). If there is none,
+            # then we can assume the last point applies to the end of the pan (360)
+            i = np.searchsorted(self._occ_az, azimuth, side="right")
+            np.minimum(i, len(self._occ_az) - 1, out=i)
 
-                    # If the Occlusion Point elevation is greater than the current elevation, then it is occluded.
-                    if obj["elevation"] > elevation:
-                        return False
-                    else:
-                        return True
-                    break
-            return True
+            # If the Occlusion Point elevation is greater than the current elevation, then it is occluded.
+            return ~(self._occ_el[i] > elevation)
         else:
-            return self.min_tilt <= elevation <= self.max_tilt
-        
+            return (self.min_tilt <= elevation) & (elevation <= self.max_tilt)
+
     def _target_selection_callback(
         self: Any, _client: mqtt.Client, _userdata: Dict[Any, Any], msg: Any
     ) -> None:
-        payload_dict = json.loads(str(msg.payload.decode("utf-8")))
+        now = time()
+        push_timestamp = str(int(now))
+        payload_dict = json.loads(msg.payload)
 
         if "ObjectLedger" in payload_dict.keys():
             object_ledger_json = payload_dict["ObjectLedger"]
-            object_ledger_df = pd.read_json(
-                StringIO(object_ledger_json), convert_dates=False, convert_axes=False
+            # The ledger is serialized with DataFrame.to_json, so it is a
+            # column oriented mapping of column to object id to value
+            object_ledger_df = pd.DataFrame.from_dict(
+                json.loads(object_ledger_json), orient="columns"
             )
 
 
-            if len(object_ledger_df):
+            # check the required columns before reading any of them, since
+            # the camera angles cannot be computed without them
+            missing_keys = self._REQUIRED_OBJECT_KEYS.difference(
+                object_ledger_df.columns
+            )
+            if len(object_ledger_df) and missing_keys:
+                logging.info(
+                    f"Required keys missing from object ledger data, skipping target selection: {sorted(missing_keys)}"
+                )
+            elif len(object_ledger_df):
                 ### some logic to select which target
-                object_ledger_df["age"] = time() - object_ledger_df["timestamp"]
+                # Extract the object columns once as float arrays
+                timestamp = _to_float_array(object_ledger_df["timestamp"])
+                latitude = _to_float_array(object_ledger_df["latitude"])
+                longitude = _to_float_array(object_ledger_df["longitude"])
+                altitude = _to_float_array(object_ledger_df["altitude"])
+
+                object_ledger_df["age"] = now - timestamp
                 object_ledger_df["target"] = False
                 object_ledger_df["selectable"] = False
 
                 (
-                    object_ledger_df["camera_pan"],
-                    object_ledger_df["camera_tilt"],
-                    object_ledger_df["distance_3d"],
-                ) = zip(
-                    *object_ledger_df.apply(
-                        lambda x: self._calculate_camera_angles(x.to_dict()),
-                        axis=1,
-                    )
-                )
-                object_ledger_df["relative_distance"] = object_ledger_df.apply(
-                    lambda x: self._relative_distance_meters(
-                        self.device_latitude,
-                        self.device_longitude,
-                        float(x["latitude"]),
-                        float(x["longitude"]),
-                    ),
-                    axis=1,
+                    camera_pan,
+                    camera_tilt,
+                    distance_3d,
+                ) = self._calculate_camera_angles_vec(
+                    timestamp,
+                    longitude,
+                    latitude,
+                    altitude,
+                    _to_float_array(object_ledger_df["track"]),
+                    _to_float_array(object_ledger_df["horizontal_velocity"]),
+                    _to_float_array(object_ledger_df["vertical_velocity"]),
+                    now,
                 )
-
-                object_ledger_df["tilt_fail"] = object_ledger_df.apply(
-                    lambda x: not self._elevation_check(x["camera_pan"], x["camera_tilt"]),
-                    axis=1
-                )
-
-
-                object_ledger_df["min_altitude_fail"] = (
-                    object_ledger_df["altitude"] < self.min_altitude
-                )
-                object_ledger_df["max_altitude_fail"] = (
-                    object_ledger_df["altitude"] > self.max_altitude
+                relative_distance = self._relative_distance_meters_vec(
+                    latitude, longitude
                 )
 
-                # check if we have any objects in the ledger 
-                if not object_ledger_df.empty: 
-                    
-                    # do we have an override object set?
-                    if self.override_object:
-                        logging.debug("Override object selection")
+                # Compute the filter flags once as arrays, publishing them
+                # with the ledger and reusing them for the selection mask
+                tilt_fail = ~self._elevation_check_vec(camera_pan, camera_tilt)
+                min_altitude_fail = altitude < self.min_altitude
+                max_altitude_fail = altitude > self.max_altitude
+
+                object_ledger_df["camera_pan"] = camera_pan
+                object_ledger_df["camera_tilt"] = camera_tilt
+                object_ledger_df["distance_3d"] = distance_3d
+                object_ledger_df["relative_distance"] = relative_distance
+                object_ledger_df["tilt_fail"] = tilt_fail
+                object_ledger_df["min_altitude_fail"] = min_altitude_fail
+                object_ledger_df["max_altitude_fail"] = max_altitude_fail
+
+                # do we have an override object set?
+                if self.override_object:
+                    logging.debug("Override object selection")
+                    if self.override_object in object_ledger_df.index:
+                        logging.debug(
+                            "Selecting Override object: %s", self.override_object
+                        )
                         selection_df = object_ledger_df.loc[
                             object_ledger_df.index == self.override_object
                         ]
-                        selection_df = selection_df.sort_values(by="age", ascending=True)
-                        if not selection_df.empty:
-                            logging.debug(f"Selecting Override object: {self.override_object}")
-                            self.tracked_object = selection_df.iloc[0]
-                        else:
-                            logging.info(f"Override object {self.override_object} not found in Ledger, clearing override object")
-                            self.tracked_object = None
-                            self.override_object = None
+                        # only the youngest row is used, so find it
+                        # without sorting
+                        self.tracked_object = selection_df.iloc[
+                            selection_df["age"].argmin()
+                        ]
                     else:
-                        # select a subset of the ledge that meets the criteria
-                        target_ledger_df = object_ledger_df[
-                            (
-                                object_ledger_df["relative_distance"]
-                                <= self.object_distance_threshold
-                            )
-                            & (object_ledger_df["tilt_fail"] == False)
-                            & (object_ledger_df["min_altitude_fail"] == False)
-                            & (object_ledger_df["max_altitude_fail"] == False)
+                        logging.info(f"Override object {self.override_object} not found in Ledger, clearing override object")
+                        self.tracked_object = None
+                        self.override_object = None
+                else:
+                    # select a subset of the ledge that meets the criteria
+                    target_ledger_df = object_ledger_df[
+                        (relative_distance <= self.object_distance_threshold)
+                        & ~(tilt_fail | min_altitude_fail | max_altitude_fail)
+                    ]
+
+                    # are there any objects that meet the criteria?
+                    if not target_ledger_df.empty:
+                        logging.debug("Object[s] within distance threshold")
+                        target_ledger_df.loc[:, "selectable"] = True
+                        # only the closest row is used, so find it
+                        # without sorting
+                        potential_target = target_ledger_df.iloc[
+                            target_ledger_df["relative_distance"].argmin()
                         ]
+                        potential_target.loc["target"] = True
 
-                        # are there any objects that meet the criteria?
-                        if not target_ledger_df.empty:
-                            logging.debug("Object[s] within distance threshold")
-                            target_ledger_df.loc[:, "selectable"] = True
-                            potential_target = target_ledger_df.sort_values(
-                                by="relative_distance", ascending=True
-                            ).iloc[0]
-                            potential_target.loc["target"] = True
 
-
-                            # are we currently tracking an object?
-                            if self.tracked_object is not None:
+                        # are we currently tracking an object?
+                        if self.tracked_object is not None:
  
-                                current_target_ledger = target_ledger_df.loc[target_ledger_df.index == self.tracked_object.name]
-                                
-                                # is the current target still within the criteria?
-                                if not current_target_ledger.empty:
-                                    current_target = current_target_ledger.iloc[0]
-
-                                    # is there a potential target that is closer and over the threshold?
-                                    if potential_target is not None:
-                                        distance_improvement_percent = (current_target["relative_distance"] - potential_target["relative_distance"]) / current_target["relative_distance"]
-                                        if distance_improvement_percent > self.distance_improvement_threshold:
-                                            logging.info(f"Switching Aircraft - Improvement in distance: {distance_improvement_percent} (percent)")
-                                            self.tracked_object = potential_target
-                                        else:
-                                            self.tracked_object = current_target
-                                
-                                # handle the case where the current target is no longer within the criteria
-                                else:
-                                    logging.info("Switching Aircraft - Current target no longer within criteria")
-                                    self.tracked_object = potential_target
-
-                            # handle the case where we are not currently tracking an object, and there is a potential target
-                            elif potential_target is not None:
-                                self.tracked_object = potential_target
+                            current_target_ledger = target_ledger_df.loc[target_ledger_df.index == self.tracked_object.name]
+                            
+                            # is the current target still within the criteria?
+                            if not current_target_ledger.empty:
+                                current_target = current_target_ledger.iloc[0]
+
+                                # is there a potential target that is closer and over the threshold?
+                                if potential_target is not None:
+                                    distance_improvement_percent = (current_target["relative_distance"] - potential_target["relative_distance"]) / current_target["relative_distance"]
+                                    if distance_improvement_percent > self.distance_improvement_threshold:
+                                        logging.info(f"Switching Aircraft - Improvement in distance: {distance_improvement_percent} (percent)")
+                                        self.tracked_object = potential_target
+                                    else:
+                                        self.tracked_object = current_target
+                            
+                            # handle the case where the current target is no longer within the criteria
                             else:
-                                self.tracked_object = None
-
+                                logging.info("Switching Aircraft - Current target no longer within criteria")
+                                self.tracked_object = potential_target
 
+                        # handle the case where we are not currently tracking an object, and there is a potential target
+                        elif potential_target is not None:
+                            self.tracked_object = potential_target
                         else:
-                            logging.debug("No object[s] within distance threshold")
                             self.tracked_object = None
 
 
+                    else:
+                        logging.debug("No object[s] within distance threshold")
+                        self.tracked_object = None
+
+
+
+                # never publish a selection with fields made up for
+                # data the ledger does not carry
+                if self.tracked_object is not None:
+                    missing_fields = [
+                        key
+                        for key, _ in self._PAYLOAD_FIELDS
+                        if key not in self.tracked_object
+                    ]
+                    if missing_fields:
+                        logging.info(
+                            f"Selected object missing payload fields, skipping selection: {missing_fields}"
+                        )
+                        self.tracked_object = None
 
                 if self.tracked_object is not None:
                     logging.debug(
-                        f"Payload ready, is override: {self.override_object is not None} or is standard: {self.override_object is None}"
+                        "Payload ready, is override: %s or is standard: %s",
+                        self.override_object is not None,
+                        self.override_object is None,
                     )
                     payload = {
                         "timestamp": float(self.tracked_object["timestamp"]),
                         "data": {
                             "object_id": str(self.tracked_object.name),
-                            "object_type": str(self.tracked_object["object_type"]),
-                            "timestamp": float(self.tracked_object["timestamp"]),
-                            "latitude": float(self.tracked_object["latitude"]),
-                            "longitude": float(self.tracked_object["longitude"]),
-                            "altitude": float(self.tracked_object["altitude"]),
-                            "track": float(self.tracked_object["track"]),
-                            "horizontal_velocity": float(self.tracked_object["horizontal_velocity"]),
-                            "vertical_velocity": float(self.tracked_object["vertical_velocity"]),
-                            "relative_distance": float(self.tracked_object["relative_distance"]),
-                            "camera_tilt": float(self.tracked_object["camera_tilt"]),
-                            "camera_pan": float(self.tracked_object["camera_pan"]),
-                            "distance_3d": float(self.tracked_object["distance_3d"]),
-                            "age": float(self.tracked_object["age"]),
+                            **{
+                                key: cast(self.tracked_object[key])
+                                for key, cast in self._PAYLOAD_FIELDS
+                            },
                         },
                     }
-                    logging.debug(f"This is the selected target {payload}")
+                    logging.debug("This is the selected target %s", payload)
 
                     out_json = self.generate_payload_json(
-                        push_timestamp=str(int(datetime.utcnow().timestamp())),
+                        push_timestamp=push_timestamp,
                         device_type="Collector",
                         id_=self.hostname,
                         deployment_id=f"ShipScan-{self.hostname}",
@@ -585,13 +667,15 @@ class C2PubSub(BaseMQTTPubSub):
                         model_version="null",
                         firmware_version="v0.0.0",
                         data_payload_type="Selected Object",
-                        data_payload=json.dumps(payload["data"]),
+                        data_payload=json.dumps(payload["data"], separators=(",", ":")),
                     )
 
                     success = self.publish_to_topic(self.object_topic, out_json)
                     if success:
                         logging.debug(
-                            f"Successfully sent data: {out_json} on topic: {self.object_topic}"
+                            "Successfully sent data: %s on topic: %s",
+                            out_json,
+                            self.object_topic,
                         )
                     else:
                         logging.warning(
@@ -599,7 +683,7 @@ class C2PubSub(BaseMQTTPubSub):
                         )
                 else:
                     out_json = self.generate_payload_json(
-                        push_timestamp=str(int(datetime.utcnow().timestamp())),
+                        push_timestamp=push_timestamp,
                         device_type="Collector",
                         id_=self.hostname,
                         deployment_id=f"ShipScan-{self.hostname}",
@@ -609,13 +693,15 @@ class C2PubSub(BaseMQTTPubSub):
                         model_version="null",
                         firmware_version="v0.0.0",
                         data_payload_type="Selected Object",
-                        data_payload=json.dumps({}),
+                        data_payload="{}",
                     )
 
                     success = self.publish_to_topic(self.object_topic, out_json)
                     if success:
                         logging.debug(
-                            f"Successfully sent data: {out_json} on topic: {self.object_topic}"
+                            "Successfully sent data: %s on topic: %s",
+                            out_json,
+                            self.object_topic,
                         )
                     else:
                         logging.warning(
@@ -623,30 +709,67 @@ class C2PubSub(BaseMQTTPubSub):
                         )
 
 
-                out_json = self.generate_payload_json(
-                    push_timestamp=str(int(datetime.utcnow().timestamp())),
-                    device_type="Collector",
-                    id_=self.hostname,
-                    deployment_id=f"ShipScan-{self.hostname}",
-                    current_location="-90, -180",
-                    status="Debug",
-                    message_type="Event",
-                    model_version="null",
-                    firmware_version="v0.0.0",
-                    data_payload_type="Prioritized Object Ledger",
-                    data_payload=object_ledger_df.to_json(),
+                # Only republish the prioritized ledger if the inbound
+                # ledger, the filter thresholds, or the selection changed,
+                # or if the last publish is old enough that the age and
+                # lead time columns are stale
+                ledger_hash = hashlib.blake2b(
+                    object_ledger_json.encode(), digest_size=8
                 )
-
-                success = self.publish_to_topic(
-                    self.prioritized_ledger_topic, out_json
+                ledger_hash.update(
+                    repr(
+                        (
+                            self.min_tilt,
+                            self.max_tilt,
+                            self.min_altitude,
+                            self.max_altitude,
+                            self.override_object,
+                            None
+                            if self.tracked_object is None
+                            else str(self.tracked_object.name),
+                        )
+                    ).encode()
                 )
-                if success:
-                    logging.debug(
-                        f"Successfully sent data: {out_json} on topic: {self.object_topic}"
-                    )
+                if (
+                    ledger_hash.digest() == self._last_ledger_hash
+                    and now - self._last_ledger_publish_time
+                    < self.LEDGER_REPUBLISH_INTERVAL
+                ):
+                    logging.debug("Prioritized ledger unchanged, skipping publish")
                 else:
-                    logging.warning(
-                        f"Failed to send data: {out_json} on topic: {self.object_topic}"
+                    out_json = self.generate_payload_json(
+                        push_timestamp=push_timestamp,
+                        device_type="Collector",
+                        id_=self.hostname,
+                        deployment_id=f"ShipScan-{self.hostname}",
+                        current_location="-90, -180",
+                        status="Debug",
+                        message_type="Event",
+                        model_version="null",
+                        firmware_version="v0.0.0",
+                        data_payload_type="Prioritized Object Ledger",
+                        data_payload=object_ledger_df.to_json(),
+                    )
+
+                    # Publish at QoS 0, where success only means the message
+                    # was queued locally. A ledger the broker drops is not
+                    # resent, but it is superseded by the next changed
+                    # ledger, or by the forced republish after
+                    # LEDGER_REPUBLISH_INTERVAL seconds
+                    success = self.publish_to_topic(
+                        self.prioritized_ledger_topic, out_json, qos=0
+                    )
+                    if success:
+                        self._last_ledger_hash = ledger_hash.digest()
+                        self._last_ledger_publish_time = now
+                        logging.debug(
+                            "Successfully sent data: %s on topic: %s",
+                            out_json,
+                            self.prioritized_ledger_topic,
+                        )
+                    else:
+                        logging.warning(
+                            f"Failed to send data: {out_json} on topic: {self.prioritized_ledger_topic}"
                         )
         if "ObjectIDOverride" in payload_dict.keys():
             self.override_object = str(payload_dict["ObjectIDOverride"])
@@ -672,8 +795,10 @@ class C2PubSub(BaseMQTTPubSub):
             try:
                 # flush pending scheduled tasks
                 schedule.run_pending()
-                # sleep to avoid running at CPU time
-                sleep(0.001)
+                # sleep until the next scheduled task is due, MQTT
+                # messages are handled by the client network loop thread
+                idle_seconds = schedule.idle_seconds()
+                sleep(1.0 if idle_seconds is None else max(idle_seconds, 0.0))
             except KeyboardInterrupt as exception:
                 if self.debug:
                     print(exception)